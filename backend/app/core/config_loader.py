@@ -4,11 +4,18 @@
 import yaml
 import os
 import logging
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, FrozenSet
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it; it parses several times faster
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 # Define a type alias for loaded YAML data for clarity
 ConfigData = Dict[str, Any]
 
@@ -26,13 +33,13 @@ def _load_yaml_file(file_path: Path) -> Optional[ConfigData]:
         logger.error(f"Configuration file not found: {file_path}")
         return None
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-            if data is None: # Handle empty files
-                 logger.warning(f"Configuration file is empty: {file_path}")
-                 return {}
-            logger.info(f"Successfully loaded configuration from: {file_path}")
-            return data
+        # Read raw bytes in one call and let the YAML parser decode them (UTF-8 unless a BOM says otherwise)
+        data = yaml.load(file_path.read_bytes(), Loader=YamlSafeLoader)
+        if data is None: # Handle empty files
+             logger.warning(f"Configuration file is empty: {file_path}")
+             return {}
+        logger.info(f"Successfully loaded configuration from: {file_path}")
+        return data
     except yaml.YAMLError as e:
         logger.exception(f"Error parsing YAML file {file_path}: {e}") # Log full traceback
         return None
@@ -57,6 +64,105 @@ def _index_list_by_id(data: Optional[ConfigData], list_key: str, id_key: str = '
                 logger.warning(f"Item in list '{list_key}' is not a dict or missing key '{id_key}': {item}")
     return indexed_dict
 
+def _index_intelligence_operations(data: Optional[ConfigData]) -> Dict[str, Any]:
+    """Helper function to index universal and civilization-specific intel operations by ID."""
+    operations = (data or {}).get('operations') or {}
+    indexed_dict = _index_list_by_id(operations, 'universal', 'id')
+    civ_specific = operations.get('civilization_specific') or {}
+    for civ_id in civ_specific:
+        for op_id, op in _index_list_by_id(civ_specific, civ_id, 'id').items():
+            if op_id in indexed_dict:
+                logger.warning(f"Duplicate intelligence operation ID '{op_id}' found for civilization '{civ_id}'. Overwriting.")
+            indexed_dict[op_id] = op
+    return indexed_dict
+
+def _group_intelligence_operations_by_civ(data: Optional[ConfigData], civ_ids: List[str]) -> Dict[str, List[Any]]:
+    """Helper function to precompute, per civilization, the universal ops plus that civ's own specific ops."""
+    operations = (data or {}).get('operations') or {}
+    universal_ops = list(_index_list_by_id(operations, 'universal', 'id').values())
+    civ_specific = operations.get('civilization_specific') or {}
+    grouped = {}
+    for civ_id in set(civ_ids) | set(civ_specific):
+        grouped[civ_id] = universal_ops + list(_index_list_by_id(civ_specific, civ_id, 'id').values())
+    return grouped
+
+def _build_communication_restrictions(civilizations: Dict[str, Any]) -> FrozenSet[FrozenSet[str]]:
+    """Helper function to collect per-civ communication restrictions into a set of symmetric civ ID pairs."""
+    restricted_pairs = set()
+    for civ_id, civ_data in civilizations.items():
+        for other_civ_id in civ_data.get('communication_restrictions') or []:
+            restricted_pairs.add(frozenset((civ_id, other_civ_id)))
+    return frozenset(restricted_pairs)
+
+def _index_systems_by_civilization(sector_map: Optional[ConfigData]) -> Dict[str, Any]:
+    """Helper function to index star systems by each civilization listed in their 'owner_civs'."""
+    indexed_dict = {}
+    for system in (sector_map or {}).get('systems') or []:
+        if not isinstance(system, dict):
+            continue
+        for civ_id in system.get('owner_civs') or []:
+            if civ_id in indexed_dict:
+                logger.warning(f"Civilization '{civ_id}' owns more than one system ('{indexed_dict[civ_id].get('id')}', '{system.get('id')}'). Overwriting.")
+            indexed_dict[civ_id] = system
+    return indexed_dict
+
+def _group_systems_by_type(sector_map: Optional[ConfigData]) -> Dict[str, List[Any]]:
+    """Helper function to group star systems by their 'type' (e.g. TradeHub, DeadStar, Homeworld)."""
+    grouped = {}
+    for system in (sector_map or {}).get('systems') or []:
+        if isinstance(system, dict) and 'type' in system:
+            grouped.setdefault(system['type'], []).append(system)
+        else:
+            logger.warning(f"System in sector map is not a dict or missing key 'type': {system}")
+    return grouped
+
+def _compute_shortest_paths(sector_map: Optional[ConfigData]) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Precomputes the shortest Star Gate path between every pair of connected systems.
+
+    Runs one breadth-first search per system over the (undirected) connections in
+    sector_map.yaml, so path lookups during play are plain dict reads.
+
+    Returns:
+        A dict mapping from_system_id -> {to_system_id: [from_system_id, ..., to_system_id]}.
+        Unreachable destinations (e.g. Kokoro, which has no gates) are omitted.
+    """
+    sector_map = sector_map or {}
+    adjacency: Dict[str, List[str]] = {}
+    for system in sector_map.get('systems') or []:
+        if isinstance(system, dict) and 'id' in system:
+            adjacency.setdefault(system['id'], [])
+    for connection in sector_map.get('connections') or []:
+        system_a, system_b = connection.get('system_a'), connection.get('system_b')
+        if system_a is None or system_b is None:
+            logger.warning(f"Connection in sector map is missing 'system_a' or 'system_b': {connection}")
+            continue
+        adjacency.setdefault(system_a, []).append(system_b)
+        adjacency.setdefault(system_b, []).append(system_a)
+
+    shortest_paths = {}
+    for start_id in adjacency:
+        parents = {start_id: None}
+        queue = deque([start_id])
+        while queue:
+            current_id = queue.popleft()
+            for neighbor_id in adjacency[current_id]:
+                if neighbor_id not in parents:
+                    parents[neighbor_id] = current_id
+                    queue.append(neighbor_id)
+
+        paths_from_start = {}
+        for end_id in parents:
+            path = []
+            step = end_id
+            while step is not None:
+                path.append(step)
+                step = parents[step]
+            path.reverse()
+            paths_from_start[end_id] = path
+        shortest_paths[start_id] = paths_from_start
+    return shortest_paths
+
 
 def load_all_configs(config_root_dir: Path) -> Dict[str, Any]:
     """
@@ -139,6 +245,12 @@ def load_all_configs(config_root_dir: Path) -> Dict[str, Any]:
         loaded_configs["uber_tech_by_id"] = _index_list_by_id(loaded_configs.get("uber_tech_raw"), "uber_tech", "id")
         loaded_configs["universal_projects_by_id"] = _index_list_by_id(loaded_configs.get("universal_projects_raw"), "universal_projects", "id")
         loaded_configs["joiners_by_id"] = _index_list_by_id(loaded_configs.get("joiners_raw"), "universal_joiners", "id") # Note list key from yaml
+        loaded_configs["intelligence_operations_by_id"] = _index_intelligence_operations(loaded_configs.get("intelligence_operations"))
+        loaded_configs["intelligence_operations_by_civ"] = _group_intelligence_operations_by_civ(loaded_configs.get("intelligence_operations"), list(loaded_configs["civilizations"]))
+        loaded_configs["communication_restricted_pairs"] = _build_communication_restrictions(loaded_configs["civilizations"])
+        loaded_configs["systems_by_civilization"] = _index_systems_by_civilization(loaded_configs.get("sector_map"))
+        loaded_configs["systems_by_type"] = _group_systems_by_type(loaded_configs.get("sector_map"))
+        loaded_configs["sector_shortest_paths"] = _compute_shortest_paths(loaded_configs.get("sector_map"))
 
         # Optionally remove raw lists after indexing if not needed directly
         # del loaded_configs["resources_raw"]
@@ -5,7 +5,7 @@
 import os
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, List, Any, Optional, FrozenSet
 
 # Import the loader function
 from .config_loader import load_all_configs
@@ -23,12 +23,16 @@ class Settings:
     # Attributes to hold loaded config data
     game_settings: Dict[str, Any] = {}
     sector_map: Dict[str, Any] = {}
+    systems_by_civilization: Dict[str, Any] = {} # Home system, indexed by owning Civ ID
+    systems_by_type: Dict[str, List[Any]] = {} # Star systems grouped by 'type' (TradeHub, DeadStar, ...)
+    sector_shortest_paths: Dict[str, Dict[str, List[str]]] = {} # from_system_id -> {to_system_id: path}
     resources_raw: Dict[str, Any] = {} # Example if keeping raw
     resources_by_id: Dict[str, Any] = {}
     initial_state: Dict[str, Any] = {}
     black_market: Dict[str, Any] = {}
     conclave: Dict[str, Any] = {}
     civilizations: Dict[str, Any] = {} # Indexed by Civ ID
+    communication_restricted_pairs: FrozenSet[FrozenSet[str]] = frozenset() # Symmetric {civ_a, civ_b} pairs
     big_tech_raw: Dict[str, Any] = {} # Example if keeping raw
     big_tech_by_id: Dict[str, Any] = {}
     uber_tech_raw: Dict[str, Any] = {} # Example if keeping raw
@@ -39,10 +43,19 @@ class Settings:
     joiners_by_id: Dict[str, Any] = {}
     initial_blueprints: Dict[str, Any] = {}
     intelligence_operations: Dict[str, Any] = {}
+    intelligence_operations_by_id: Dict[str, Any] = {} # Universal + civ-specific ops, indexed by op ID
+    intelligence_operations_by_civ: Dict[str, List[Any]] = {} # Ops available to each civ (universal + own), by Civ ID
     intelligence_mechanics: Dict[str, Any] = {}
 
+    _instance: Optional["Settings"] = None # The single shared instance
     _loaded: bool = False # Flag to ensure loading happens only once
 
+    def __new__(cls):
+        # Always hand back the same instance, so a second Settings() sees the already loaded data
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
         if not Settings._loaded:
             logger.info(f"Initializing configuration settings from path: {self.CONFIG_PATH}")
@@ -52,12 +65,16 @@ class Settings:
                 # Assign loaded data to class attributes
                 self.game_settings = loaded_data.get("game_settings", {})
                 self.sector_map = loaded_data.get("sector_map", {})
+                self.systems_by_civilization = loaded_data.get("systems_by_civilization", {})
+                self.systems_by_type = loaded_data.get("systems_by_type", {})
+                self.sector_shortest_paths = loaded_data.get("sector_shortest_paths", {})
                 self.resources_raw = loaded_data.get("resources_raw", {}) # Keep or remove based on need
                 self.resources_by_id = loaded_data.get("resources_by_id", {})
                 self.initial_state = loaded_data.get("initial_state", {})
                 self.black_market = loaded_data.get("black_market", {})
                 self.conclave = loaded_data.get("conclave", {})
                 self.civilizations = loaded_data.get("civilizations", {})
+                self.communication_restricted_pairs = loaded_data.get("communication_restricted_pairs", frozenset())
                 self.big_tech_raw = loaded_data.get("big_tech_raw", {}) # Keep or remove based on need
                 self.big_tech_by_id = loaded_data.get("big_tech_by_id", {})
                 self.uber_tech_raw = loaded_data.get("uber_tech_raw", {}) # Keep or remove based on need
@@ -68,6 +85,8 @@ class Settings:
                 self.joiners_by_id = loaded_data.get("joiners_by_id", {})
                 self.initial_blueprints = loaded_data.get("initial_blueprints", {})
                 self.intelligence_operations = loaded_data.get("intelligence_operations", {})
+                self.intelligence_operations_by_id = loaded_data.get("intelligence_operations_by_id", {})
+                self.intelligence_operations_by_civ = loaded_data.get("intelligence_operations_by_civ", {})
                 self.intelligence_mechanics = loaded_data.get("intelligence_mechanics", {})
 
                 Settings._loaded = True
@@ -93,6 +112,31 @@ class Settings:
     def get_civilization(self, civ_id: str) -> Optional[Dict[str, Any]]:
         return self.civilizations.get(civ_id)
 
+    def can_civilizations_communicate(self, civ_id_a: str, civ_id_b: str) -> bool:
+        return frozenset((civ_id_a, civ_id_b)) not in self.communication_restricted_pairs
+
+    def get_intelligence_operation(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        return self.intelligence_operations_by_id.get(operation_id)
+
+    def get_intelligence_operations_for_civilization(self, civ_id: str) -> List[Dict[str, Any]]:
+        return self.intelligence_operations_by_civ.get(civ_id, [])
+
+    def get_civilization_system(self, civ_id: str) -> Optional[Dict[str, Any]]:
+        return self.systems_by_civilization.get(civ_id)
+
+    def get_systems_by_type(self, system_type: str) -> List[Dict[str, Any]]:
+        return self.systems_by_type.get(system_type, [])
+
+    def get_hub_systems(self) -> List[Dict[str, Any]]:
+        return self.get_systems_by_type("TradeHub")
+
+    def get_dead_star_systems(self) -> List[Dict[str, Any]]:
+        return self.get_systems_by_type("DeadStar")
+
+    def get_shortest_path(self, from_system_id: str, to_system_id: str) -> Optional[List[str]]:
+        """Returns the precomputed shortest Star Gate path (inclusive of both ends), or None if unreachable."""
+        return self.sector_shortest_paths.get(from_system_id, {}).get(to_system_id)
+
     # Add more accessors as needed...
 
 
@@ -1,17 +1,17 @@
-import sys
-print(sys.path)
-
 # File Path: backend/app/main.py (TEMPORARY MINIMAL VERSION)
 # Purpose: Basic FastAPI app without any config loading for testing core functionality.
 
+import sys
 import logging
 import datetime
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 # --- Basic Logging Setup ---
 # Crucial to see startup messages in Docker logs
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+logger.debug("--- Minimal main.py: sys.path = %s ---", sys.path) # Lazy formatting: no work unless DEBUG is enabled
 
 logger.info("--- Minimal main.py: Attempting to create FastAPI app instance ---")
 
@@ -20,7 +20,8 @@ try:
     app = FastAPI(
         title="Stellar Accord - Minimal Test Server",
         description="This is a temporary minimal server instance used for debugging setup issues. It does NOT load game configuration.",
-        version="0.0.1"
+        version="0.0.1",
+        default_response_class=ORJSONResponse # orjson serializes responses much faster than stdlib json
     )
     logger.info(f"--- Minimal main.py: FastAPI app instance '{app.title}' created successfully ---")
 